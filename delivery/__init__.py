@@ -5,6 +5,7 @@ Supports: Telegram DM, webhooks, and email.
 
 import os
 import json
+import asyncio
 import urllib.request
 import urllib.error
 from datetime import datetime, timezone
@@ -189,13 +190,13 @@ async def deliver_summary(
         
         elif method == 'webhook':
             print("📤 Sending to webhook...")
-            results['webhook'] = post_webhook(summary, group_name, day_label, webhook_url)
+            results['webhook'] = await asyncio.to_thread(post_webhook, summary, group_name, day_label, webhook_url)
             if results['webhook']:
                 print("✅ Posted to webhook!")
         
         elif method == 'email':
             print("📤 Sending email...")
-            results['email'] = send_email(summary, group_name, day_label, email_to)
+            results['email'] = await asyncio.to_thread(send_email, summary, group_name, day_label, email_to)
             if results['email']:
                 print("✅ Email sent!")
         
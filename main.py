@@ -1,9 +1,11 @@
 import os
 import sys
+import argparse
 from datetime import datetime, timedelta, timezone
 from telethon import TelegramClient
 from telethon.tl.types import Channel, Chat
 import asyncio
+from search import MEDIA_PLACEHOLDER, index_messages, search_messages, validate_date
 
 async def fetch_messages(group_username_or_id, days_ago=0):
     api_id = os.getenv('TELEGRAM_API_ID')
@@ -68,7 +70,7 @@ async def fetch_and_display_messages(client, group_username_or_id, day_start, da
                 elif hasattr(message.sender, 'title'):
                     sender_name = message.sender.title
             
-            msg_text = message.text or "[Media/Sticker/Other]"
+            msg_text = message.text or MEDIA_PLACEHOLDER
             
             messages.append({
                 'id': message.id,
@@ -81,6 +83,8 @@ async def fetch_and_display_messages(client, group_username_or_id, day_start, da
         print(f"❌ Error fetching messages: {e}")
         return
     
+    await asyncio.to_thread(index_messages, group_username_or_id, messages)
+    
     day_label = "today" if (datetime.now(timezone.utc).date() == day_start.date()) else day_start.strftime('%Y-%m-%d')
     print(f"\n📊 Found {message_count} messages from {day_label}\n")
     print("=" * 80)
@@ -93,10 +97,66 @@ async def fetch_and_display_messages(client, group_username_or_id, day_start, da
     
     print("\n✅ Done!")
 
+def search_command(argv):
+    parser = argparse.ArgumentParser(
+        prog='main.py search',
+        description='Search previously fetched messages (offline, no Telegram API calls)',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python main.py search notion                         # Messages mentioning "notion"
+  python main.py search 'automat*'                     # Prefix match: automation, automated, ...
+  python main.py search "cold email" --sender Alex     # Filter by sender name
+  python main.py search ads --group @bulletproofscale --since 2025-10-01
+
+Environment Variables:
+  SEARCH_INDEX_PATH     - Index file location (default: message_index.db)
+        """
+    )
+    
+    parser.add_argument('query', help="Search terms (all must match, 'term*' for prefix)")
+    parser.add_argument('--sender', '-s', type=str,
+                       help='Only messages whose sender name contains this text')
+    parser.add_argument('--group', '-g', type=str,
+                       help='Only messages from this group')
+    parser.add_argument('--since', type=validate_date,
+                       help='Only messages on or after this date (YYYY-MM-DD)')
+    parser.add_argument('--until', type=validate_date,
+                       help='Only messages on or before this date (YYYY-MM-DD)')
+    parser.add_argument('--limit', '-n', type=int, default=20,
+                       help='Maximum number of results (default: 20)')
+    
+    args = parser.parse_args(argv)
+    
+    results = search_messages(
+        query=args.query,
+        sender=args.sender,
+        group=args.group,
+        since=args.since,
+        until=args.until,
+        limit=args.limit
+    )
+    
+    if not results:
+        print(f"No messages found for: {args.query}")
+        return
+    
+    print(f"🔎 {len(results)} result(s) for: {args.query}\n")
+    print("=" * 80)
+    
+    for result in results:
+        print(f"[{result['date']}] {result['group']} #{result['id']} {result['sender']}:")
+        print(f"  {result['snippet']}")
+        print("-" * 80)
+
 def main():
     group = None
     days_ago = 1
     
+    if len(sys.argv) >= 2 and sys.argv[1] == 'search':
+        search_command(sys.argv[2:])
+        return
+    
     if len(sys.argv) >= 2:
         group = sys.argv[1]
     elif os.getenv('TELEGRAM_GROUP'):
@@ -107,6 +167,7 @@ def main():
         print("  python main.py @bulletproofscale          # Yesterday's messages")
         print("  python main.py @bulletproofscale 0        # Today's messages")
         print("  python main.py @bulletproofscale 2        # Messages from 2 days ago")
+        print("  python main.py search <query>             # Search previously fetched messages")
         print("\nOr set TELEGRAM_GROUP environment variable:")
         print("  export TELEGRAM_GROUP=@publicgroupname")
         print("  python main.py")
@@ -0,0 +1,209 @@
+"""
+Local full-text search index for fetched Telegram messages.
+Messages are added incrementally whenever they are fetched, and searched
+offline with BM25 ranking (SQLite FTS5) plus sender/date/group filters.
+"""
+
+import os
+import re
+import sqlite3
+from datetime import datetime, timezone
+from typing import Optional, List, Dict
+
+DEFAULT_INDEX_PATH = 'message_index.db'
+
+# Text the fetch paths substitute for media, stickers and other non-text messages
+MEDIA_PLACEHOLDER = "[Media/Sticker/Other]"
+
+# Index files whose schema has already been created by this process
+_initialized_paths = set()
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS messages (
+    id INTEGER PRIMARY KEY,
+    chat TEXT NOT NULL,
+    msg_id INTEGER NOT NULL,
+    date TEXT NOT NULL,
+    sender TEXT NOT NULL,
+    text TEXT NOT NULL,
+    UNIQUE (chat, msg_id)
+);
+CREATE INDEX IF NOT EXISTS messages_chat_date ON messages (chat, date);
+CREATE VIRTUAL TABLE IF NOT EXISTS messages_fts USING fts5(
+    text, sender, content='messages', content_rowid='id'
+);
+CREATE TRIGGER IF NOT EXISTS messages_ai AFTER INSERT ON messages BEGIN
+    INSERT INTO messages_fts (rowid, text, sender) VALUES (new.id, new.text, new.sender);
+END;
+CREATE TRIGGER IF NOT EXISTS messages_ad AFTER DELETE ON messages BEGIN
+    INSERT INTO messages_fts (messages_fts, rowid, text, sender) VALUES ('delete', old.id, old.text, old.sender);
+END;
+CREATE TRIGGER IF NOT EXISTS messages_au AFTER UPDATE ON messages BEGIN
+    INSERT INTO messages_fts (messages_fts, rowid, text, sender) VALUES ('delete', old.id, old.text, old.sender);
+    INSERT INTO messages_fts (rowid, text, sender) VALUES (new.id, new.text, new.sender);
+END;
+"""
+
+
+def normalize_chat(group_username_or_id) -> str:
+    """Normalize a group reference so '@Group' and 'group' map to the same key."""
+    return str(group_username_or_id).strip().lstrip('@').lower()
+
+
+def open_index(path: Optional[str] = None) -> sqlite3.Connection:
+    """
+    Open (and create if needed) the search index.
+
+    Args:
+        path: Index file path (or loaded from SEARCH_INDEX_PATH env var)
+
+    Returns:
+        Open SQLite connection
+    """
+    path = path or os.getenv('SEARCH_INDEX_PATH', DEFAULT_INDEX_PATH)
+    conn = sqlite3.connect(path)
+    conn.row_factory = sqlite3.Row
+    if path not in _initialized_paths:
+        try:
+            conn.executescript(SCHEMA)
+            # Drop placeholder rows written before they were skipped at index time
+            with conn:
+                conn.execute("DELETE FROM messages WHERE text = ?", (MEDIA_PLACEHOLDER,))
+        except sqlite3.Error:
+            conn.close()
+            raise
+        _initialized_paths.add(path)
+    return conn
+
+
+def index_messages(group_username_or_id, messages: List[Dict], path: Optional[str] = None) -> int:
+    """
+    Add fetched messages to the search index. Already indexed messages are
+    updated in place, so re-fetching a day is safe. Media/sticker messages
+    have no text to search and are skipped. This blocks on disk I/O; async
+    callers should run it with asyncio.to_thread.
+
+    Args:
+        group_username_or_id: Group the messages were fetched from
+        messages: Message dicts with 'id', 'date', 'sender' and 'text' keys
+        path: Index file path (optional, can use env var)
+
+    Returns:
+        Number of messages indexed, or 0 if indexing failed
+    """
+    chat = normalize_chat(group_username_or_id)
+    rows = [
+        (chat, msg['id'], msg['date'].astimezone(timezone.utc).strftime('%Y-%m-%d %H:%M:%S'), msg['sender'], msg['text'])
+        for msg in messages
+        if msg['text'] != MEDIA_PLACEHOLDER
+    ]
+    if not rows:
+        return 0
+
+    try:
+        conn = open_index(path)
+        try:
+            with conn:
+                conn.executemany(
+                    """
+                    INSERT INTO messages (chat, msg_id, date, sender, text) VALUES (?, ?, ?, ?, ?)
+                    ON CONFLICT (chat, msg_id) DO UPDATE SET sender = excluded.sender, text = excluded.text
+                    WHERE sender != excluded.sender OR text != excluded.text
+                    """,
+                    rows
+                )
+        finally:
+            conn.close()
+        return len(rows)
+    except sqlite3.Error as e:
+        print(f"⚠️  Search indexing failed: {e}")
+        return 0
+
+
+def build_match_query(query: str) -> str:
+    """
+    Turn free text into an FTS5 query matching all terms exactly in the message
+    text; a trailing '*' makes a term a prefix match. Senders are filtered separately.
+    """
+    terms = re.findall(r'(\w+)(\*?)', query)
+    if not terms:
+        return ''
+    return '{text} : (' + ' '.join(f'"{term}"{star}' for term, star in terms) + ')'
+
+
+def search_messages(
+    query: str,
+    sender: Optional[str] = None,
+    group: Optional[str] = None,
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+    limit: int = 20,
+    path: Optional[str] = None
+) -> List[Dict]:
+    """
+    Search indexed messages, best BM25 matches first.
+
+    Args:
+        query: Free-text search terms matched against message text (all must match, 'term*' for prefix)
+        sender: Only messages whose sender name contains this text
+        group: Only messages from this group
+        since: Only messages on or after this date (YYYY-MM-DD)
+        until: Only messages on or before this date (YYYY-MM-DD)
+        limit: Maximum number of results
+        path: Index file path (optional, can use env var)
+
+    Returns:
+        List of result dicts with 'group', 'id', 'date', 'sender', 'text', 'snippet'
+    """
+    match = build_match_query(query)
+    if not match:
+        return []
+
+    sql = """
+        SELECT m.chat, m.msg_id, m.date, m.sender, m.text,
+               snippet(messages_fts, 0, '[', ']', '…', 12) AS snippet
+        FROM messages_fts
+        JOIN messages m ON m.id = messages_fts.rowid
+        WHERE messages_fts MATCH ?
+    """
+    params = [match]
+
+    if sender:
+        sql += " AND m.sender LIKE ?"
+        params.append(f"%{sender}%")
+    if group:
+        sql += " AND m.chat = ?"
+        params.append(normalize_chat(group))
+    if since:
+        sql += " AND m.date >= ?"
+        params.append(since)
+    if until:
+        sql += " AND m.date < date(?, '+1 day')"
+        params.append(until)
+
+    sql += " ORDER BY bm25(messages_fts) LIMIT ?"
+    params.append(limit)
+
+    conn = open_index(path)
+    try:
+        rows = conn.execute(sql, params).fetchall()
+    finally:
+        conn.close()
+
+    return [
+        {
+            'group': row['chat'],
+            'id': row['msg_id'],
+            'date': row['date'],
+            'sender': row['sender'],
+            'text': row['text'],
+            'snippet': row['snippet'],
+        }
+        for row in rows
+    ]
+
+
+def validate_date(value: str) -> str:
+    """Check a YYYY-MM-DD date string, returning it unchanged."""
+    datetime.strptime(value, '%Y-%m-%d')
+    return value
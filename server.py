@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""
+Local HTTP API for on-demand Telegram summaries.
+Keeps one Telegram and one OpenAI client warm across requests, coalesces
+concurrent identical requests onto a single computation, and serves finished
+summaries from memory.
+
+Endpoints:
+  GET /summary?group=@bulletproofscale&days_ago=1
+  GET /health
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import asyncio
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from urllib.parse import urlsplit, parse_qs
+from summarize import MAX_DAYS_AGO, connect_client, fetch_messages_for_summary, generate_summary
+
+HTTP_REASONS = {
+    200: 'OK',
+    400: 'Bad Request',
+    404: 'Not Found',
+    405: 'Method Not Allowed',
+    500: 'Internal Server Error',
+    502: 'Bad Gateway',
+}
+
+
+class SummaryError(Exception):
+    """Raised when a summary could not be fetched or generated."""
+
+
+class SummaryService:
+    """
+    Single-flight, memoized wrapper around fetch_messages_for_summary and generate_summary.
+
+    Past days are cached until evicted. Summaries of the current day are cached for
+    `today_ttl` seconds and never past UTC midnight, since new messages keep arriving.
+    At most `max_entries` results are kept; the least recently used ones are evicted first.
+    """
+
+    def __init__(self, client, today_ttl: int = 300, max_entries: int = 256):
+        self.client = client
+        self.today_ttl = today_ttl
+        self.max_entries = max_entries
+        self._inflight = {}
+        self._results = OrderedDict()
+
+    @staticmethod
+    def _cache_key(group: str, day: str):
+        return (group.lstrip('@').lower(), day)
+
+    async def get_summary(self, group: str, days_ago: int) -> dict:
+        """Return the summary for `group` on the day `days_ago` days back, computing it at most once."""
+        # Resolve the day once so the cache key and the fetched range always agree
+        target_day = datetime.now(timezone.utc) - timedelta(days=days_ago)
+        key = self._cache_key(group, target_day.date().isoformat())
+
+        cached = self._results.get(key)
+        if cached:
+            result, expires_at = cached
+            if expires_at is None or time.monotonic() < expires_at:
+                self._results.move_to_end(key)
+                return result
+            del self._results[key]
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._compute(key, group, target_day))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+
+        # Shield so a disconnecting caller does not cancel the work other callers await
+        return await asyncio.shield(task)
+
+    async def _compute(self, key, group: str, target_day: datetime) -> dict:
+        started = datetime.now(timezone.utc)
+        messages, day_label, _ = await fetch_messages_for_summary(group, client=self.client, target_day=target_day)
+        if messages is None:
+            raise SummaryError(f"Failed to fetch messages from {group}")
+
+        summary = None
+        if messages:
+            summary = await asyncio.to_thread(generate_summary, messages, day_label, group)
+            if not summary:
+                raise SummaryError("Failed to generate summary")
+
+        result = {
+            'group': group,
+            'date': key[1],
+            'day_label': day_label,
+            'message_count': len(messages),
+            'summary': summary,
+            'generated_at': str(datetime.now(timezone.utc)),
+        }
+
+        expires_at = None
+        day_end = (target_day + timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
+        if started < day_end:
+            # The day was still in progress when fetched; refresh after the TTL or at midnight, whichever is first
+            now = datetime.now(timezone.utc)
+            expires_at = time.monotonic() + min(self.today_ttl, (day_end - now).total_seconds())
+        self._store(key, result, expires_at)
+        return result
+
+    def _store(self, key, result: dict, expires_at):
+        """Memoize a result, dropping expired entries and the least recently used beyond the cap."""
+        now = time.monotonic()
+        for stale in [k for k, (_, exp) in self._results.items() if exp is not None and exp <= now]:
+            del self._results[stale]
+
+        self._results[key] = (result, expires_at)
+        self._results.move_to_end(key)
+        while len(self._results) > self.max_entries:
+            self._results.popitem(last=False)
+
+
+async def write_json(writer, status: int, payload: dict):
+    """Write a JSON HTTP response."""
+    body = json.dumps(payload).encode('utf-8')
+    head = (
+        f"HTTP/1.1 {status} {HTTP_REASONS.get(status, '')}\r\n"
+        "Content-Type: application/json\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        "Connection: close\r\n\r\n"
+    )
+    writer.write(head.encode('ascii') + body)
+    await writer.drain()
+
+
+async def handle_request(service: SummaryService, reader, writer):
+    """Serve a single HTTP request."""
+    try:
+        request_line = await reader.readline()
+        while (await reader.readline()) not in (b'\r\n', b'\n', b''):
+            pass
+
+        parts = request_line.decode('latin-1').split()
+        if len(parts) < 2:
+            await write_json(writer, 400, {'error': 'Malformed request'})
+            return
+
+        method, target = parts[0], parts[1]
+        url = urlsplit(target)
+
+        if method != 'GET':
+            await write_json(writer, 405, {'error': f'Method {method} not allowed'})
+            return
+
+        if url.path == '/health':
+            await write_json(writer, 200, {'status': 'ok'})
+            return
+
+        if url.path != '/summary':
+            await write_json(writer, 404, {'error': f'Unknown path {url.path}'})
+            return
+
+        query = parse_qs(url.query)
+        group = query.get('group', [None])[0]
+        if not group:
+            await write_json(writer, 400, {'error': 'Missing required parameter: group'})
+            return
+
+        try:
+            days_ago = int(query.get('days_ago', ['1'])[0])
+        except ValueError:
+            await write_json(writer, 400, {'error': 'days_ago must be a number'})
+            return
+        if not 0 <= days_ago <= MAX_DAYS_AGO:
+            await write_json(writer, 400, {'error': f'days_ago must be between 0 and {MAX_DAYS_AGO}'})
+            return
+
+        try:
+            result = await service.get_summary(group, days_ago)
+        except SummaryError as e:
+            await write_json(writer, 502, {'error': str(e)})
+            return
+
+        await write_json(writer, 200, result)
+
+    except (ConnectionError, asyncio.IncompleteReadError):
+        pass
+    except Exception as e:
+        print(f"❌ Error handling request: {e}")
+        try:
+            await write_json(writer, 500, {'error': 'Internal server error'})
+        except ConnectionError:
+            pass
+    finally:
+        writer.close()
+
+
+async def serve(host: str, port: int, today_ttl: int, max_entries: int):
+    client = await connect_client()
+    if client is None:
+        sys.exit(1)
+
+    service = SummaryService(client, today_ttl=today_ttl, max_entries=max_entries)
+    server = await asyncio.start_server(
+        lambda r, w: handle_request(service, r, w), host, port
+    )
+
+    print(f"🚀 Summary API listening on http://{host}:{port}")
+    print(f"   Try: curl 'http://{host}:{port}/summary?group=@bulletproofscale&days_ago=1'")
+
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        await client.disconnect()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Local HTTP API for Telegram summaries',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python server.py                        # Listen on 127.0.0.1:8080
+  python server.py --port 9000            # Custom port
+
+Environment Variables:
+  SUMMARY_CACHE_TTL     - Seconds to cache today's summary (default: 300)
+  SUMMARY_CACHE_SIZE    - Maximum number of cached summaries (default: 256)
+        """
+    )
+
+    parser.add_argument('--host', type=str, default='127.0.0.1',
+                       help='Interface to bind (default: 127.0.0.1)')
+    parser.add_argument('--port', '-p', type=int, default=8080,
+                       help='Port to listen on (default: 8080)')
+    parser.add_argument('--cache-ttl', type=int, default=int(os.getenv('SUMMARY_CACHE_TTL', '300')),
+                       help="Seconds to cache today's summary (overrides SUMMARY_CACHE_TTL)")
+    parser.add_argument('--cache-size', type=int, default=int(os.getenv('SUMMARY_CACHE_SIZE', '256')),
+                       help='Maximum number of cached summaries (overrides SUMMARY_CACHE_SIZE)')
+
+    args = parser.parse_args()
+
+    if args.cache_size < 1:
+        parser.error("--cache-size must be at least 1")
+
+    try:
+        asyncio.run(serve(args.host, args.port, args.cache_ttl, args.cache_size))
+    except KeyboardInterrupt:
+        print("\n👋 Server stopped")
+
+if __name__ == "__main__":
+    main()
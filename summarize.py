@@ -14,9 +14,15 @@ from telethon.sessions import StringSession
 import asyncio
 from openai import OpenAI
 from delivery import deliver_summary
+from search import MEDIA_PLACEHOLDER, index_messages
 
-async def fetch_messages_for_summary(group_username_or_id, days_ago=0):
-    """Fetch messages from Telegram for summarization. Returns (messages, day_label, client)."""
+_openai_client = None
+
+# Roughly ten years; also keeps `now - timedelta(days=...)` far from datetime's range limits
+MAX_DAYS_AGO = 3650
+
+async def connect_client():
+    """Create and authorize a TelegramClient from environment credentials. Returns the client or None."""
     api_id = os.getenv('TELEGRAM_API_ID')
     api_hash = os.getenv('TELEGRAM_API_HASH')
     phone = os.getenv('TELEGRAM_PHONE')
@@ -34,10 +40,6 @@ async def fetch_messages_for_summary(group_username_or_id, days_ago=0):
     
     print("🔐 Authenticating with Telegram...")
     
-    target_day = datetime.now(timezone.utc) - timedelta(days=days_ago)
-    day_start = target_day.replace(hour=0, minute=0, second=0, microsecond=0)
-    day_end = target_day.replace(hour=23, minute=59, second=59, microsecond=999999)
-    
     if session_string:
         client = TelegramClient(StringSession(session_string), int(api_id), api_hash)
     else:
@@ -48,9 +50,28 @@ async def fetch_messages_for_summary(group_username_or_id, days_ago=0):
     if not await client.is_user_authorized():
         print("❌ Not authorized! Please run: python authenticate.py")
         await client.disconnect()
-        return None, None, None
+        return None
     
     print("✅ Authenticated!")
+    return client
+
+async def fetch_messages_for_summary(group_username_or_id, days_ago=0, client=None, target_day=None):
+    """
+    Fetch messages from Telegram for summarization. Returns (messages, day_label, client).
+    Pass an already-connected client to reuse it; otherwise a new one is created.
+    Pass a UTC datetime as target_day to fetch that day instead of resolving days_ago.
+    """
+    owns_client = client is None
+    if owns_client:
+        client = await connect_client()
+        if client is None:
+            return None, None, None
+    
+    if target_day is None:
+        target_day = datetime.now(timezone.utc) - timedelta(days=days_ago)
+    day_start = target_day.replace(hour=0, minute=0, second=0, microsecond=0)
+    day_end = target_day.replace(hour=23, minute=59, second=59, microsecond=999999)
+    
     print(f"\n📥 Fetching messages from: {group_username_or_id}")
     print(f"📅 Date range: {day_start.strftime('%Y-%m-%d %H:%M')} to {day_end.strftime('%Y-%m-%d %H:%M')}")
     
@@ -58,7 +79,10 @@ async def fetch_messages_for_summary(group_username_or_id, days_ago=0):
     message_count = 0
     
     try:
-        async for message in client.iter_messages(group_username_or_id, limit=None):
+        # Start from the end of the target day instead of the newest message,
+        # so fetching an older day does not page through everything after it
+        next_day_start = day_end + timedelta(microseconds=1)
+        async for message in client.iter_messages(group_username_or_id, limit=None, offset_date=next_day_start):
             if message.date > day_end:
                 continue
             if message.date < day_start:
@@ -75,9 +99,11 @@ async def fetch_messages_for_summary(group_username_or_id, days_ago=0):
                 elif hasattr(message.sender, 'title'):
                     sender_name = message.sender.title
             
-            msg_text = message.text or "[Media/Sticker/Other]"
+            msg_text = message.text or MEDIA_PLACEHOLDER
             
             messages.append({
+                'id': message.id,
+                'date': message.date,
                 'time': message.date.strftime('%H:%M:%S'),
                 'sender': sender_name,
                 'text': msg_text
@@ -85,9 +111,12 @@ async def fetch_messages_for_summary(group_username_or_id, days_ago=0):
     
     except Exception as e:
         print(f"❌ Error fetching messages: {e}")
-        await client.disconnect()
+        if owns_client:
+            await client.disconnect()
         return None, None, None
     
+    await asyncio.to_thread(index_messages, group_username_or_id, messages)
+    
     day_label = "today" if (datetime.now(timezone.utc).date() == day_start.date()) else day_start.strftime('%Y-%m-%d')
     print(f"✅ Fetched {message_count} messages from {day_label}\n")
     
@@ -118,13 +147,11 @@ Please be concise but thorough. Focus on actionable insights and the most valuab
     
     return prompt
 
-def generate_summary(messages, day_label, group_name):
-    """Generate AI summary using OpenAI."""
-    if not messages:
-        print("❌ No messages to summarize!")
-        return None
-    
-    print("🤖 Generating AI summary with GPT-4o...\n")
+def get_openai_client():
+    """Return a shared OpenAI client, creating it on first use. Returns None if credentials are missing."""
+    global _openai_client
+    if _openai_client is not None:
+        return _openai_client
     
     api_key = os.getenv('AI_INTEGRATIONS_OPENAI_API_KEY')
     base_url = os.getenv('AI_INTEGRATIONS_OPENAI_BASE_URL')
@@ -136,10 +163,23 @@ def generate_summary(messages, day_label, group_name):
         print("\nPlease ensure the Replit AI Integration is properly set up.")
         return None
     
-    client = OpenAI(
+    _openai_client = OpenAI(
         api_key=api_key,
         base_url=base_url
     )
+    return _openai_client
+
+def generate_summary(messages, day_label, group_name):
+    """Generate AI summary using OpenAI."""
+    if not messages:
+        print("❌ No messages to summarize!")
+        return None
+    
+    print("🤖 Generating AI summary with GPT-4o...\n")
+    
+    client = get_openai_client()
+    if client is None:
+        return None
     
     prompt = create_summary_prompt(messages, day_label, group_name)
     
@@ -161,6 +201,113 @@ def generate_summary(messages, day_label, group_name):
         print(f"❌ Error generating summary: {e}")
         return None
 
+def print_summary(summary, day_label, message_count):
+    """Print a finished summary to the console."""
+    print("=" * 80)
+    print(f"📊 SUMMARY - {day_label.upper()}")
+    print("=" * 80)
+    print()
+    print(summary)
+    print()
+    print("=" * 80)
+    print(f"✅ Summary complete! ({message_count} messages analyzed)")
+
+async def deliver(args, summary, day_label, client):
+    """Deliver a summary using the methods selected on the command line."""
+    print()
+    delivery_methods = [m.strip() for m in args.deliver.split(',')]
+    results = await deliver_summary(
+        summary=summary,
+        group_name=args.group,
+        day_label=day_label,
+        delivery_methods=delivery_methods,
+        telegram_client=client,
+        webhook_url=args.webhook_url,
+        email_to=args.email_to
+    )
+    
+    success_count = sum(1 for success in results.values() if success)
+    total_count = len(results)
+    print(f"\n📬 Delivery: {success_count}/{total_count} successful")
+
+def parse_backfill_range(value):
+    """Parse a START..END days-ago range (e.g. 1..30). Returns days_ago values, oldest day first."""
+    try:
+        start, end = (int(part) for part in value.split('..'))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid range '{value}' (expected START..END, e.g. 1..30)")
+    
+    if not (0 <= start <= MAX_DAYS_AGO and 0 <= end <= MAX_DAYS_AGO):
+        raise argparse.ArgumentTypeError(f"days ago must be between 0 and {MAX_DAYS_AGO}")
+    
+    return list(range(max(start, end), min(start, end) - 1, -1))
+
+async def summarize_day(client, group, days_ago, fetch_slots, summary_slots):
+    """
+    Fetch and summarize one day on a shared client. Returns (messages, day_label, summary).
+    Each stage holds its own semaphore, so later days can fetch while earlier ones summarize.
+    """
+    async with fetch_slots:
+        messages, day_label, _ = await fetch_messages_for_summary(group, days_ago, client=client)
+    if not messages:
+        return messages, day_label, None
+    
+    async with summary_slots:
+        summary = await asyncio.to_thread(generate_summary, messages, day_label, group)
+    return messages, day_label, summary
+
+async def run_backfill(args):
+    """
+    Summarize a range of days on one Telegram client. Fetching and summarizing
+    are each bounded by --workers and overlap across days, while finished days
+    are printed and delivered in date order.
+    """
+    client = await connect_client()
+    if client is None:
+        sys.exit(1)
+    
+    days = args.backfill
+    print(f"⏪ Backfilling {len(days)} day(s) with {args.workers} worker(s)")
+    
+    fetch_slots = asyncio.Semaphore(args.workers)
+    summary_slots = asyncio.Semaphore(args.workers)
+    tasks = [
+        asyncio.create_task(summarize_day(client, args.group, days_ago, fetch_slots, summary_slots))
+        for days_ago in days
+    ]
+    
+    failed = 0
+    try:
+        for days_ago, task in zip(days, tasks):
+            messages, day_label, summary = await task
+            
+            if messages is None:
+                print(f"❌ Failed to fetch messages from {days_ago} day(s) ago")
+                failed += 1
+                continue
+            
+            if len(messages) == 0:
+                print(f"No messages found for {day_label}")
+                continue
+            
+            if not summary:
+                print(f"❌ Failed to generate summary for {day_label}")
+                failed += 1
+                continue
+            
+            print_summary(summary, day_label, len(messages))
+            
+            if args.deliver:
+                await deliver(args, summary, day_label, client)
+    finally:
+        for task in tasks:
+            task.cancel()
+        await client.disconnect()
+    
+    print(f"\n⏪ Backfill complete: {len(days) - failed}/{len(days)} day(s) succeeded")
+    if failed:
+        sys.exit(1)
+
 async def main():
     parser = argparse.ArgumentParser(
         description='AI-powered Telegram message summarizer with delivery options',
@@ -172,6 +319,7 @@ Examples:
   python summarize.py @bulletproofscale --deliver telegram # Send to your Telegram DM
   python summarize.py @bulletproofscale --deliver webhook  # POST to webhook
   python summarize.py @bulletproofscale --deliver telegram,webhook  # Multiple delivery methods
+  python summarize.py @bulletproofscale --backfill 1..30   # One summary per day for the last 30 days
   
 Environment Variables:
   SUMMARY_WEBHOOK_URL   - Default webhook URL
@@ -189,9 +337,20 @@ Environment Variables:
                        help='Webhook URL (overrides SUMMARY_WEBHOOK_URL)')
     parser.add_argument('--email-to', type=str,
                        help='Email recipient (overrides SUMMARY_EMAIL_TO)')
+    parser.add_argument('--backfill', type=parse_backfill_range, metavar='START..END',
+                       help='Summarize every day in a days-ago range (e.g. 1..30), oldest first; ignores days_ago')
+    parser.add_argument('--workers', '-w', type=int, default=4,
+                       help='Concurrent fetches and concurrent summaries in backfill mode (default: 4 each)')
     
     args = parser.parse_args()
     
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    
+    if args.backfill:
+        await run_backfill(args)
+        return
+    
     messages, day_label, client = await fetch_messages_for_summary(args.group, args.days_ago)
     
     if messages is None:
@@ -213,31 +372,10 @@ Environment Variables:
             await client.disconnect()
         sys.exit(1)
     
-    print("=" * 80)
-    print(f"📊 SUMMARY - {day_label.upper()}")
-    print("=" * 80)
-    print()
-    print(summary)
-    print()
-    print("=" * 80)
-    print(f"✅ Summary complete! ({len(messages)} messages analyzed)")
+    print_summary(summary, day_label, len(messages))
     
     if args.deliver:
-        print()
-        delivery_methods = [m.strip() for m in args.deliver.split(',')]
-        results = await deliver_summary(
-            summary=summary,
-            group_name=args.group,
-            day_label=day_label,
-            delivery_methods=delivery_methods,
-            telegram_client=client,
-            webhook_url=args.webhook_url,
-            email_to=args.email_to
-        )
-        
-        success_count = sum(1 for success in results.values() if success)
-        total_count = len(results)
-        print(f"\n📬 Delivery: {success_count}/{total_count} successful")
+        await deliver(args, summary, day_label, client)
     
     if client:
         await client.disconnect()